@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import copy
 import threading
 from typing import Any
 
+from pydantic import ValidationError
 from pydantic_settings import BaseSettings
 
 from .._constants.default_key import DEFAULT_KEY
 from .._types.settings_key import SettingsKey
+from .._utils.equal_dict import equal_dict
+from .._utils.intern_key import intern_key
+from .._utils.snapshot_dict import snapshot_dict
 from .._utils.update_dict import update_dict
 
+_MULTI_CONFIG_KEYS = frozenset({"default", "configs", "aliases"})
+
 
 class SettingsManager[T: BaseSettings]:
     """
@@ -19,6 +26,20 @@ class SettingsManager[T: BaseSettings]:
     - For multi mode (multi=True): allows multiple named configurations
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_active_key",
+        "_aliases",
+        "_cache",
+        "_cached_settings",
+        "_cli_args",
+        "_default_key",
+        "_lock",
+        "_user_config",
+        "multi",
+        "settings_cls",
+    )
+
     def __init__(self, settings_cls: type[T], *, multi: bool = False):
         self.settings_cls: type[T] = settings_cls
         self.multi: bool = multi
@@ -28,51 +49,56 @@ class SettingsManager[T: BaseSettings]:
         self._active_key: SettingsKey | None = None
         self._cli_args: dict[str, Any] = {}
         self._cache: dict[str, T] = {}
-        self._cache_valid: bool = False
+        self._cached_settings: T | None = None
         self._lock: threading.RLock = threading.RLock()
 
     @property
     def all_settings(self) -> dict[str, T]:
         with self._lock:
-            self._ensure_cache()
-            return self._cache.copy()
+            return {key: self._get_cached_settings(key) for key in self._settings_keys()}
 
     @property
     def settings(self) -> T:
+        # Lock-free fast path; writers reset the shortcut under the lock.
+        settings = self._cached_settings
+        if settings is not None:
+            return settings
+
         with self._lock:
-            self._ensure_cache()
+            settings = self._cached_settings = self._resolve_active_settings()
+            return settings
 
-            if not self.multi:
-                return self._cache[DEFAULT_KEY]
+    def _resolve_active_settings(self) -> T:
+        if not self.multi:
+            return self._get_cached_settings(DEFAULT_KEY)
 
-            target_key = self._active_key if self._active_key is not None else self._default_key
+        target_key = self._active_key if self._active_key is not None else self._default_key
 
-            if target_key is None:
-                target_key = DEFAULT_KEY
+        if target_key is None:
+            target_key = DEFAULT_KEY
 
-            resolved_key = self._resolve_alias(target_key)
+        resolved_key = self._resolve_alias(target_key)
 
-            if resolved_key not in self._cache:
-                if target_key != resolved_key:
-                    raise ValueError(
-                        f"Key '{target_key}' (resolved to '{resolved_key}') "
-                        f"does not exist in settings map"
-                    )
-                raise ValueError(f"Key '{target_key}' does not exist in settings map")
+        if not self._has_settings_key(resolved_key):
+            if target_key != resolved_key:
+                raise ValueError(
+                    f"Key '{target_key}' (resolved to '{resolved_key}') "
+                    f"does not exist in settings map"
+                )
+            raise ValueError(f"Key '{target_key}' does not exist in settings map")
 
-            return self._cache[resolved_key]
+        return self._get_cached_settings(resolved_key)
 
     @property
     def user_config(self) -> dict[str, Any]:
-        import copy
-
         with self._lock:
             if self.multi:
                 result: dict[str, Any] = {"configs": copy.deepcopy(self._user_config)}
                 if self._default_key is not None:
                     result["default"] = self._default_key
                 if self._aliases:
-                    result["aliases"] = copy.deepcopy(self._aliases)
+                    # Alias names and targets are strings, so a shallow copy is enough.
+                    result["aliases"] = dict(self._aliases)
                 return result
 
             return copy.deepcopy(self._user_config.get(DEFAULT_KEY, {}))
@@ -81,8 +107,7 @@ class SettingsManager[T: BaseSettings]:
     def user_config(self, value: dict[str, Any]) -> None:
         with self._lock:
             if self.multi:
-                allowed_multi_keys = {"default", "configs", "aliases"}
-                unknown_keys = set(value) - allowed_multi_keys
+                unknown_keys = value.keys() - _MULTI_CONFIG_KEYS
                 if unknown_keys:
                     raise ValueError(
                         f"Invalid multi configuration keys: {sorted(unknown_keys)}. "
@@ -99,13 +124,23 @@ class SettingsManager[T: BaseSettings]:
                 if not isinstance(configs, dict):
                     raise TypeError("`configs` must be a dictionary.")
 
+                # Structural snapshots keep caller-side mutations of nested containers out of
+                # the stored configs that per-key invalidation compares against.
                 normalized_configs: dict[str, dict[str, Any]] = {}
+                changed_keys: list[str] = []
                 for key, config in configs.items():
                     if not isinstance(key, str):
                         raise TypeError("All config names in `configs` must be strings.")
                     if not isinstance(config, dict):
                         raise TypeError(f"Config '{key}' must be a dictionary.")
-                    normalized_configs[key] = dict(config)
+
+                    key = intern_key(key)
+                    current = self._user_config.get(key)
+                    if current is not None and equal_dict(current, config):
+                        normalized_configs[key] = current
+                    else:
+                        normalized_configs[key] = snapshot_dict(config)
+                        changed_keys.append(key)
 
                 aliases_value = value.get("aliases", {})
                 if aliases_value is None:
@@ -118,23 +153,30 @@ class SettingsManager[T: BaseSettings]:
                 for alias, target in aliases_value.items():
                     if not isinstance(alias, str) or not isinstance(target, str):
                         raise TypeError("All alias names and targets must be strings.")
-                    aliases[alias] = target
+                    aliases[intern_key(alias)] = intern_key(target)
 
                 default = value.get("default", None)
                 if default is not None and not isinstance(default, str):
                     raise TypeError("`default` must be a string or None.")
 
+                self._invalidate(*changed_keys, *(self._user_config.keys() - normalized_configs))
+                if default != self._default_key:
+                    self._invalidate(DEFAULT_KEY)
+
                 self._user_config = normalized_configs
                 self._aliases = aliases
-                self._default_key = default
+                self._default_key = intern_key(default) if default is not None else None
                 self._active_key = None
+                self._cached_settings = None
                 self._validate_aliases()
                 self._validate_default_key()
 
             else:
-                self._user_config[DEFAULT_KEY] = dict(value)
-
-            self._cache_valid = False
+                # Reassigning an equal config (e.g. a reload loop) keeps the cached settings.
+                current = self._user_config.get(DEFAULT_KEY)
+                if current is None or not equal_dict(current, value):
+                    self._user_config[DEFAULT_KEY] = snapshot_dict(value)
+                    self._invalidate(DEFAULT_KEY)
 
     def _validate_aliases(self) -> None:
         for alias in self._aliases:
@@ -169,7 +211,9 @@ class SettingsManager[T: BaseSettings]:
             raise ValueError("Setting active_key is only available in multi mode")
 
         with self._lock:
-            self._active_key = key
+            if key != self._active_key:
+                self._active_key = intern_key(key) if key is not None else None
+                self._cached_settings = None
 
     @property
     def cli_args(self) -> dict[str, Any]:
@@ -180,7 +224,7 @@ class SettingsManager[T: BaseSettings]:
     def cli_args(self, value: dict[str, Any]) -> None:
         with self._lock:
             self._cli_args = dict(value)
-            self._cache_valid = False
+            self._invalidate_all()
 
     def set_cli_args(self, target: str, value: Any) -> None:
         with self._lock:
@@ -188,13 +232,13 @@ class SettingsManager[T: BaseSettings]:
             d = self._cli_args
 
             for key in keys[:-1]:
+                d = d.setdefault(key, {})
+
                 if not isinstance(d, dict):
                     raise ValueError(f"Invalid target path: {target}")
 
-                d = d.setdefault(key, {})
-
             d[keys[-1]] = value
-            self._cache_valid = False
+            self._invalidate_all()
 
     def get_settings(self, key: SettingsKey | None = None) -> T:
         if not self.multi:
@@ -207,18 +251,16 @@ class SettingsManager[T: BaseSettings]:
             return self.settings
 
         with self._lock:
-            self._ensure_cache()
-
             resolved_key = self._resolve_alias(key)
 
-            if resolved_key not in self._cache:
+            if not self._has_settings_key(resolved_key):
                 if key != resolved_key:
                     raise ValueError(
                         f"Key '{key}' (resolved to '{resolved_key}') does not exist in settings map"
                     )
                 raise ValueError(f"Key '{key}' does not exist in settings map")
 
-            return self._cache[resolved_key]
+            return self._get_cached_settings(resolved_key)
 
     def reset_user_config(self) -> None:
         with self._lock:
@@ -226,11 +268,11 @@ class SettingsManager[T: BaseSettings]:
             self._aliases = {}
             self._default_key = None
             self._active_key = None
-            self._cache_valid = False
+            self._invalidate_all()
 
     def clear(self) -> None:
         with self._lock:
-            self._cache_valid = False
+            self._invalidate_all()
 
     def _resolve_alias(self, key: str, *, _chain: list[str] | None = None) -> str:
         if not self._aliases:
@@ -248,36 +290,46 @@ class SettingsManager[T: BaseSettings]:
 
         return self._resolve_alias(self._aliases[key], _chain=[*_chain, key])
 
-    def _ensure_cache(self) -> None:
-        if not self._cache_valid:
-            self._rebuild_cache()
+    def _invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._cache.pop(key, None)
+        self._cached_settings = None
 
-    def _rebuild_cache(self) -> None:
-        if self.multi:
-            self._cache = {}
+    def _invalidate_all(self) -> None:
+        self._cache.clear()
+        self._cached_settings = None
 
-            for key, user_config in self._user_config.items():
-                if isinstance(user_config, dict):
-                    self._cache[key] = self._build_settings(
-                        key, update_dict(user_config, self._cli_args)
-                    )
-
-            if self._default_key is None and DEFAULT_KEY not in self._cache:
-                self._cache[DEFAULT_KEY] = self._build_settings(DEFAULT_KEY, dict(self._cli_args))
+    def _settings_keys(self) -> list[str]:
+        if not self.multi:
+            return [DEFAULT_KEY]
 
-        else:
-            self._cache = {
-                DEFAULT_KEY: self._build_settings(
-                    DEFAULT_KEY,
-                    update_dict(self._user_config.get(DEFAULT_KEY, {}), self._cli_args),
-                )
-            }
+        keys = list(self._user_config)
+        if self._default_key is None and DEFAULT_KEY not in self._user_config:
+            keys.append(DEFAULT_KEY)
+        return keys
 
-        self._cache_valid = True
+    def _has_settings_key(self, key: str) -> bool:
+        if not self.multi:
+            return key == DEFAULT_KEY
+        if key in self._user_config:
+            return True
+        return key == DEFAULT_KEY and self._default_key is None
+
+    def _get_cached_settings(self, key: str) -> T:
+        # Settings are built lazily on first access and kept until their key is invalidated.
+        settings = self._cache.get(key)
+        if settings is None:
+            data = self._merge_cli_args(self._user_config.get(key, {}))
+            settings = self._cache[key] = self._build_settings(key, data)
+        return settings
+
+    def _merge_cli_args(self, user_config: dict[str, Any]) -> dict[str, Any]:
+        # Without nested CLI overrides a flat merge is equivalent to a deep update.
+        if any(isinstance(value, dict) for value in self._cli_args.values()):
+            return update_dict(user_config, self._cli_args)
+        return {**user_config, **self._cli_args}
 
     def _build_settings(self, config_key: str, data: dict[str, Any]) -> T:
-        from pydantic import ValidationError
-
         try:
             return self.settings_cls(**data)
         except ValidationError as e:
@@ -0,0 +1,22 @@
+from typing import Any
+
+
+def equal_dict(base: dict[str, Any], target: dict[str, Any]) -> bool:
+    """Return whether base and target are deeply equal, including value types."""
+    if base.keys() != target.keys():
+        return False
+
+    return all(_equal_value(base[key], target[key]) for key in base)
+
+
+def _equal_value(base: Any, target: Any) -> bool:
+    if type(base) is not type(target):
+        return False
+
+    if isinstance(base, dict):
+        return equal_dict(base, target)
+
+    if isinstance(base, list | tuple):
+        return len(base) == len(target) and all(map(_equal_value, base, target))
+
+    return bool(base == target)
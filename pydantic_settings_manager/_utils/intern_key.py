@@ -0,0 +1,9 @@
+import sys
+
+
+def intern_key(key: str) -> str:
+    """Return the interned key, or the key itself when it is a str subclass."""
+    if type(key) is str:
+        return sys.intern(key)
+
+    return key
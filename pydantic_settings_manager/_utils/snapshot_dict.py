@@ -0,0 +1,23 @@
+from typing import Any
+
+
+def snapshot_dict(value: dict[str, Any]) -> dict[str, Any]:
+    """Return a structural copy of value.
+
+    Nested ``dict``, ``list`` and ``tuple`` containers are copied recursively, while
+    leaf values (and container subclasses) are kept by reference.
+    """
+    return {key: _snapshot_value(item) for key, item in value.items()}
+
+
+def _snapshot_value(value: Any) -> Any:
+    if type(value) is dict:
+        return snapshot_dict(value)
+
+    if type(value) is list:
+        return [_snapshot_value(item) for item in value]
+
+    if type(value) is tuple:
+        return tuple(_snapshot_value(item) for item in value)
+
+    return value
@@ -2,7 +2,12 @@
 Tests for SettingsManager (unified settings manager)
 """
 
+import threading
+import weakref
+from typing import Any
+
 import pytest
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
 from pydantic_settings_manager import DEFAULT_KEY, SettingsManager
@@ -23,6 +28,32 @@ class RequiredFieldSettings(BaseSettings):
     debug: bool = False
 
 
+class NestedOptions(BaseModel):
+    """Nested options model for testing"""
+
+    host: str = "localhost"
+    port: int = 8000
+
+
+class NestedSettings(BaseSettings):
+    """Settings class with a nested model for testing"""
+
+    name: str = "default"
+    options: NestedOptions = NestedOptions()
+
+
+class NumberSettings(BaseSettings):
+    """Settings class with a numeric union field for testing"""
+
+    number: int | float = 0
+
+
+class AnyValueSettings(BaseSettings):
+    """Settings class with an arbitrary value field for testing"""
+
+    obj: Any = None
+
+
 # Single Mode Tests
 
 
@@ -86,6 +117,17 @@ def test_clear_single_mode() -> None:
     assert updated_settings.value == 100
 
 
+def test_nested_cli_args_deep_merge_single_mode() -> None:
+    """Test that nested CLI arguments are deep-merged into the user config"""
+    manager = SettingsManager(NestedSettings)
+    manager.user_config = {"name": "from_file", "options": {"host": "example.com", "port": 80}}
+    manager.set_cli_args("options.port", 8080)
+
+    assert manager.settings.name == "from_file"
+    assert manager.settings.options.host == "example.com"
+    assert manager.settings.options.port == 8080
+
+
 def test_all_settings_single_mode() -> None:
     """Test all_settings property in single mode"""
     manager = SettingsManager(ExampleSettings)
@@ -348,6 +390,17 @@ def test_set_cli_args_nested() -> None:
     assert cli_args["nested"]["key"] == "test_value"
 
 
+def test_set_cli_args_invalid_target_path() -> None:
+    """Test set_cli_args raises when an intermediate node is not a dict"""
+    manager = SettingsManager(ExampleSettings)
+    manager.cli_args = {"value": 42}
+
+    with pytest.raises(ValueError, match=r"Invalid target path: value\.key"):
+        manager.set_cli_args("value.key", "test_value")
+
+    assert manager.cli_args == {"value": 42}
+
+
 def test_all_settings_multi_mode() -> None:
     """Test all_settings property in multi mode"""
     manager = SettingsManager(ExampleSettings, multi=True)
@@ -401,6 +454,13 @@ def test_clear_multi_mode() -> None:
 # Edge Cases Tests
 
 
+def test_weak_reference() -> None:
+    """Test that managers can be weakly referenced"""
+    manager = SettingsManager(ExampleSettings)
+
+    assert weakref.ref(manager)() is manager
+
+
 def test_empty_config_single_mode() -> None:
     """Test empty configuration in single mode"""
     manager = SettingsManager(ExampleSettings)
@@ -483,6 +543,54 @@ def test_cache_invalidation_on_config_change() -> None:
     assert settings2.value == 100
 
 
+def test_equal_user_config_keeps_cache_single_mode() -> None:
+    """Test that reassigning an equal config does not rebuild settings"""
+    manager = SettingsManager(ExampleSettings)
+    manager.user_config = {"name": "initial", "value": 42}
+    settings1 = manager.settings
+
+    manager.user_config = {"name": "initial", "value": 42}
+
+    assert manager.settings is settings1
+
+
+def test_nested_in_place_change_rebuilds_single_mode() -> None:
+    """Test that mutating a nested value in place and reassigning rebuilds settings"""
+    manager = SettingsManager(NestedSettings)
+    config: dict[str, Any] = {"options": {"port": 80}}
+    manager.user_config = config
+    assert manager.settings.options.port == 80
+
+    config["options"]["port"] = 9000
+    manager.user_config = config
+
+    assert manager.settings.options.port == 9000
+
+
+def test_value_type_change_rebuilds_single_mode() -> None:
+    """Test that an equal value of a different type rebuilds settings"""
+    manager = SettingsManager(NumberSettings)
+    manager.user_config = {"number": 1}
+    assert type(manager.settings.number) is int
+
+    manager.user_config = {"number": 1.0}
+
+    assert type(manager.settings.number) is float
+
+
+def test_uncopyable_value_single_mode() -> None:
+    """Test that a config may hold values that cannot be deep-copied"""
+    lock = threading.Lock()
+    manager = SettingsManager(AnyValueSettings)
+    manager.user_config = {"obj": lock}
+    settings1 = manager.settings
+    assert settings1.obj is lock
+
+    manager.user_config = {"obj": lock}
+
+    assert manager.settings is settings1
+
+
 def test_cache_invalidation_on_cli_args_change() -> None:
     """Test that cache is invalidated when CLI args change"""
     manager = SettingsManager(ExampleSettings)
@@ -500,6 +608,111 @@ def test_cache_invalidation_on_cli_args_change() -> None:
     assert settings2.value == 999
 
 
+def test_cache_invalidation_only_rebuilds_changed_keys() -> None:
+    """Test that reassigning user_config only rebuilds keys whose config changed"""
+    manager = SettingsManager(ExampleSettings, multi=True)
+    manager.user_config = {
+        "configs": {
+            "dev": {"name": "development", "value": 42},
+            "prod": {"name": "production", "value": 100},
+        }
+    }
+
+    dev1 = manager.get_settings("dev")
+    prod1 = manager.get_settings("prod")
+
+    manager.user_config = {
+        "configs": {
+            "dev": {"name": "development", "value": 42},
+            "prod": {"name": "production", "value": 200},
+        }
+    }
+
+    assert manager.get_settings("dev") is dev1
+    prod2 = manager.get_settings("prod")
+    assert prod2 is not prod1
+    assert prod2.value == 200
+
+
+def test_cache_invalidation_on_nested_in_place_change_multi_mode() -> None:
+    """Test that mutating a nested value in place and reassigning rebuilds settings"""
+    manager = SettingsManager(NestedSettings, multi=True)
+    config: dict[str, Any] = {"default": "dev", "configs": {"dev": {"options": {"port": 80}}}}
+    manager.user_config = config
+    assert manager.settings.options.port == 80
+
+    config["configs"]["dev"]["options"]["port"] = 9000
+    manager.user_config = config
+
+    assert manager.settings.options.port == 9000
+
+
+def test_cache_invalidation_on_value_type_change_multi_mode() -> None:
+    """Test that an equal value of a different type rebuilds settings"""
+    manager = SettingsManager(NumberSettings, multi=True)
+    manager.user_config = {"default": "dev", "configs": {"dev": {"number": 1}}}
+    assert type(manager.settings.number) is int
+
+    manager.user_config = {"default": "dev", "configs": {"dev": {"number": 1.0}}}
+
+    assert type(manager.settings.number) is float
+
+
+def test_uncopyable_value_multi_mode() -> None:
+    """Test that configs may hold values that cannot be deep-copied"""
+    lock = threading.Lock()
+    manager = SettingsManager(AnyValueSettings, multi=True)
+    manager.user_config = {"configs": {"a": {"obj": lock}}}
+
+    assert manager.get_settings("a").obj is lock
+
+
+def test_cache_invalidation_removes_deleted_keys() -> None:
+    """Test that keys removed from user_config are dropped from the cache"""
+    manager = SettingsManager(ExampleSettings, multi=True)
+    manager.user_config = {
+        "configs": {
+            "dev": {"name": "development"},
+            "prod": {"name": "production"},
+        }
+    }
+    assert set(manager.all_settings) == {DEFAULT_KEY, "dev", "prod"}
+
+    manager.user_config = {"default": "dev", "configs": {"dev": {"name": "development"}}}
+
+    assert set(manager.all_settings) == {"dev"}
+    with pytest.raises(ValueError, match="Key 'prod' does not exist"):
+        manager.get_settings("prod")
+
+
+def test_clear_rebuilds_all_keys() -> None:
+    """Test that clear() rebuilds every cached entry"""
+    manager = SettingsManager(ExampleSettings, multi=True)
+    manager.user_config = {"configs": {"dev": {"name": "development"}}}
+
+    dev1 = manager.get_settings("dev")
+    manager.clear()
+
+    assert manager.get_settings("dev") is not dev1
+
+
+def test_settings_are_built_lazily_per_key() -> None:
+    """Test that only the accessed configuration is validated in multi mode"""
+    manager = SettingsManager(RequiredFieldSettings, multi=True)
+    manager.user_config = {
+        "default": "dev",
+        "configs": {
+            "dev": {"name": "development"},
+            "broken": {},  # missing required field
+        },
+    }
+
+    assert manager.settings.name == "development"
+
+    with pytest.raises(ValueError):
+        manager.get_settings("broken")
+
+
 def test_thread_safety_properties() -> None:
     """Test that properties return copies for thread safety"""
     manager = SettingsManager(ExampleSettings, multi=True)
@@ -556,6 +769,20 @@ def test_alias_basic() -> None:
     assert stg_settings.value == 2
 
 
+def test_alias_retarget_updates_settings() -> None:
+    """Test that retargeting the default alias switches the active settings"""
+    configs = {
+        "dev": {"name": "development"},
+        "prod": {"name": "production"},
+    }
+    manager = SettingsManager(ExampleSettings, multi=True)
+    manager.user_config = {"default": "main", "configs": configs, "aliases": {"main": "dev"}}
+    assert manager.settings.name == "development"
+
+    manager.user_config = {"default": "main", "configs": configs, "aliases": {"main": "prod"}}
+    assert manager.settings.name == "production"
+
+
 def test_alias_multi_level() -> None:
     """Test multi-level alias (alias of alias)"""
     manager = SettingsManager(ExampleSettings, multi=True)
@@ -0,0 +1,24 @@
+from pydantic_settings_manager._utils.equal_dict import equal_dict
+
+
+def test_equal_dict() -> None:
+    base = {"a": 1, "b": {"c": [1, 2]}, "d": "x"}
+    target = {"a": 1, "b": {"c": [1, 2]}, "d": "x"}
+
+    assert equal_dict(base, target)
+
+
+def test_equal_dict_different_keys() -> None:
+    assert not equal_dict({"a": 1}, {"a": 1, "b": 2})
+    assert not equal_dict({"a": 1}, {"b": 1})
+
+
+def test_equal_dict_different_value() -> None:
+    assert not equal_dict({"a": {"b": 1}}, {"a": {"b": 2}})
+
+
+def test_equal_dict_different_type() -> None:
+    assert not equal_dict({"a": 1}, {"a": 1.0})
+    assert not equal_dict({"a": 1}, {"a": True})
+    assert not equal_dict({"a": [1]}, {"a": [1.0]})
+    assert not equal_dict({"a": [1]}, {"a": (1,)})
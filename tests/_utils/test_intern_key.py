@@ -0,0 +1,16 @@
+from enum import StrEnum
+
+from pydantic_settings_manager._utils.intern_key import intern_key
+
+
+def test_intern_key() -> None:
+    key = "".join(["pr", "od"])
+
+    assert intern_key(key) is intern_key("prod")
+
+
+def test_intern_key_str_subclass() -> None:
+    class Env(StrEnum):
+        PROD = "prod"
+
+    assert intern_key(Env.PROD) is Env.PROD
@@ -0,0 +1,30 @@
+import threading
+from typing import Any
+
+from pydantic_settings_manager._utils.snapshot_dict import snapshot_dict
+
+
+def test_snapshot_dict() -> None:
+    value: dict[str, Any] = {"a": 1, "b": {"c": [1, {"d": 2}], "e": (3, [4])}}
+
+    snapshot = snapshot_dict(value)
+    assert snapshot == value
+    assert snapshot["b"] is not value["b"]
+    assert snapshot["b"]["c"] is not value["b"]["c"]
+    assert snapshot["b"]["c"][1] is not value["b"]["c"][1]
+    assert snapshot["b"]["e"][1] is not value["b"]["e"][1]
+
+
+def test_snapshot_dict_isolates_nested_mutation() -> None:
+    value = {"a": {"b": 1}}
+
+    snapshot = snapshot_dict(value)
+    value["a"]["b"] = 2
+    assert snapshot == {"a": {"b": 1}}
+
+
+def test_snapshot_dict_keeps_leaf_references() -> None:
+    lock = threading.Lock()
+
+    snapshot = snapshot_dict({"lock": lock})
+    assert snapshot["lock"] is lock